@@ -7,6 +7,7 @@ import json
 import sys
 import constants
 from player import Player
+from animation import Animator
 
 
 # Constants
@@ -72,6 +73,9 @@ class MyGame(arcade.Window):
         # Our physics engine
         self.physics_engine = None
 
+        # Advances every animated sprite in the scene
+        self.animator = None
+
         # A Camera that can be used for scrolling the screen
         self.camera = None
 
@@ -159,6 +163,10 @@ class MyGame(arcade.Window):
         # add sprite to scene
         self.scene.add_sprite(constants.LAYER_NAME_PLAYER, self.player_sprite)
 
+        # Animate every sprite on the animated layers
+        self.animator = Animator(self.scene)
+        for layer_name in constants.ANIMATED_LAYERS:
+            self.animator.add_layer(layer_name)
 
         # --- Other stuff
         # Set the background color
@@ -322,9 +330,7 @@ class MyGame(arcade.Window):
         
 
 
-        self.scene.update_animation(
-            delta_time, [constants.LAYER_NAME_PLAYER]
-        )
+        self.animator.update()
 
 
         # Position the camera
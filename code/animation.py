@@ -0,0 +1,133 @@
+import arcade
+import constants
+
+
+def load_texture_pair(filename):
+    """
+    Load a texture pair, with the second being a mirror image.
+    """
+    return [
+        arcade.load_texture(filename),
+        arcade.load_texture(filename, flipped_horizontally=True),
+
+    ]
+
+
+class Animation():
+    """A sequence of texture pairs and how many updates each one is shown for."""
+
+    def __init__(self, texture_pairs, updates_per_frame=constants.UPDATES_PER_FRAME):
+
+        self.texture_pairs = texture_pairs
+        self.updates_per_frame = updates_per_frame
+
+        # Number of updates before the sequence starts over
+        self.length = len(texture_pairs) * updates_per_frame
+
+
+class AnimatedSprite(arcade.Sprite):
+    """A sprite with a table of animations, one for each state it can be in."""
+
+    def __init__(self, scale=1):
+
+        # Set up parent class
+        super().__init__(scale=scale)
+
+        # Maps a state (idle, walk, ...) to its Animation
+        self.animations = {}
+
+        # Default to face-right
+        self.character_face_direction = constants.RIGHT_FACING
+
+        # Track which animation is playing and how far into it we are
+        self.animation_state = None
+        self.cur_texture = 0
+
+    def add_animation(self, state, texture_pairs, updates_per_frame=constants.UPDATES_PER_FRAME):
+        """Add the frames to play while the sprite is in the given state."""
+        self.animations[state] = Animation(texture_pairs, updates_per_frame)
+
+    def get_animation_state(self):
+        """
+        Pick the animation to play from how the sprite is moving.
+        Override this for sprites that decide their state some other way.
+        """
+        if self.change_y > 0:
+            return constants.JUMP_STATE
+        elif self.change_y < 0:
+            return constants.FALL_STATE
+        elif self.change_x != 0:
+            return constants.WALK_STATE
+        return constants.IDLE_STATE
+
+    def update_animation(self, delta_time: float = 1 / 60):
+        """Advance just this sprite. Prefer adding it to an Animator."""
+        advance_animation(self)
+
+
+def advance_animation(sprite):
+    """Move a sprite one update forward in its current animation."""
+
+    # Nothing to play yet
+    if not sprite.animations:
+        return
+
+    # Figure out if we need to flip face left or right
+    if sprite.change_x < 0:
+        sprite.character_face_direction = constants.LEFT_FACING
+    elif sprite.change_x > 0:
+        sprite.character_face_direction = constants.RIGHT_FACING
+
+    # Sprites without art for a state (e.g. no jump or fall) fall back to
+    # idle, or to whatever animation they do have
+    state = sprite.get_animation_state()
+    animation = sprite.animations.get(state)
+    if animation is None:
+        state = constants.IDLE_STATE
+        animation = sprite.animations.get(state)
+        if animation is None:
+            state, animation = next(iter(sprite.animations.items()))
+
+    # Start a new animation from its first frame
+    if state != sprite.animation_state:
+        sprite.animation_state = state
+        sprite.cur_texture = 0
+        frame = 0
+
+    # Single frame animations (idle, jump, fall) never need to count
+    elif animation.length > animation.updates_per_frame:
+        sprite.cur_texture += 1
+        if sprite.cur_texture >= animation.length:
+            sprite.cur_texture = 0
+        frame = sprite.cur_texture // animation.updates_per_frame
+
+    else:
+        frame = 0
+
+    # Only set the texture when the frame shown actually changes
+    texture = animation.texture_pairs[frame][sprite.character_face_direction]
+    if texture is not sprite.texture:
+        sprite.texture = texture
+
+
+class Animator():
+    """Advances every animated sprite on the registered Scene layers in a single update."""
+
+    def __init__(self, scene):
+        self.scene = scene
+
+        # Names of the layers holding animated sprites
+        self.layer_names = []
+
+    def add_layer(self, name):
+        """Animate the AnimatedSprites on a Scene layer."""
+        if name not in self.layer_names:
+            self.layer_names.append(name)
+
+    def update(self):
+        # Read each layer from the scene every update so sprites added or
+        # removed since the last one are picked up
+        for name in self.layer_names:
+            for sprite in self.scene[name]:
+                if isinstance(sprite, AnimatedSprite):
+                    advance_animation(sprite)
@@ -30,6 +30,12 @@ GRID_PIXEL_SIZE = SPRITE_PIXEL_SIZE * TILE_SCALING
 RIGHT_FACING = 0
 LEFT_FACING = 1
 
+# animation states
+IDLE_STATE = "idle"
+WALK_STATE = "walk"
+JUMP_STATE = "jump"
+FALL_STATE = "fall"
+
 # character movement
 UPDATES_PER_FRAME = 10
 PLAYER_MOVEMENT_SPEED = 4
@@ -39,6 +45,9 @@ PLAYER_JUMP_SPEED = 17
 # layer name
 LAYER_NAME_PLAYER = "Player"
 
+# layers whose sprites are animated every update
+ANIMATED_LAYERS = [LAYER_NAME_PLAYER]
+
 
 # ------------ SOUNDS ------------
 